@@ -7,43 +7,236 @@ Version: 1.0
 Date: 7/7/2025
 """
 
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import dbm
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 import os
+import pickle
+import shelve
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import OrderedDict, defaultdict
+from decimal import Decimal, ROUND_HALF_UP
 from dotenv import load_dotenv
 
+# Faster JSON decoding when available
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Optional HTTP/2 backend for the async API
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
 # Load environment variables from .env file
 load_dotenv()
+_DEFAULT_API_KEY = os.getenv('EXCHANGE_API_KEY')
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('currency_converter.log'),
+        RotatingFileHandler(
+            'currency_converter.log', maxBytes=1_000_000, backupCount=3
+        ),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
 
+def _parse_json(content: bytes) -> Dict:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Transport errors raised by the async backends; aiohttp's ClientTimeout
+# raises asyncio.TimeoutError, which is not a ClientError
+_ASYNC_HTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+if httpx is not None:
+    _ASYNC_HTTP_ERRORS += (httpx.HTTPError,)
+
+_CENT = Decimal("0.01")
+
+
+def _round_money(value: float) -> float:
+    """
+    Round an amount to cents, half away from zero
+    
+    Plain round() is used unless the value sits on a half cent, where
+    its binary representation can round the wrong way (2.675 -> 2.67);
+    only those values take the slower Decimal route (2.675 -> 2.68).
+    """
+    magnitude = abs(value)
+    if magnitude < 1e15 and abs(magnitude * 100 % 1 - 0.5) < 1e-6:
+        exact = Decimal(str(float(value)))
+        return float(exact.quantize(_CENT, rounding=ROUND_HALF_UP))
+    return round(value, 2)
+
+
+class _RateCache(OrderedDict):
+    """Mapping that evicts its least recently used entry beyond maxsize"""
+    
+    def __init__(self, maxsize: int = 64):
+        super().__init__()
+        self.maxsize = maxsize
+        
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Example conversions for main(); all priced from a single USD fetch
+DEMO_CONVERSIONS = (
+    (100, "USD", "EUR"),
+    (100, "USD", "GBP"),
+    (100, "USD", "JPY")
+)
+# Triangulated with cross() from the same USD rates
+DEMO_CROSS_CONVERSION = (50, "GBP", "JPY")
+
+# Errors from a corrupt or concurrently written on-disk cache
+_DISK_CACHE_ERRORS = (
+    *dbm.error, pickle.UnpicklingError, KeyError, EOFError, OSError, TypeError
+)
+
+# Upper bound on threads used by warmup()
+_MAX_WARMUP_WORKERS = 8
+
+# Where main() persists rates between runs
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/currency_converter")
+
+
 class CurrencyConverter:
     """A class to handle currency conversion operations"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, backend: str = "aiohttp",
+                 cache_dir: Optional[str] = None):
         """
         Initialize the currency converter
         
         Args:
             api_key: API key for the exchange rate service
+            backend: HTTP client for the async API, "aiohttp" or "httpx"
+                (HTTP/2, requires the optional httpx[http2] package)
+            cache_dir: Directory to persist cached rates in across runs
+                (default: in-memory only)
         """
-        self.api_key = api_key or os.getenv('EXCHANGE_API_KEY')
+        if backend not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == "httpx":
+            if httpx is None:
+                raise ImportError("The httpx backend requires 'pip install httpx[http2]'")
+            try:
+                import h2  # noqa: F401 - needed by httpx for HTTP/2
+            except ImportError:
+                raise ImportError(
+                    "The httpx backend needs HTTP/2 support: 'pip install httpx[http2]'"
+                ) from None
+        self.backend = backend
+        self.api_key = api_key or _DEFAULT_API_KEY
         self.base_url = "https://api.exchangerate-api.com/v4/latest"
-        self.cache = {}
+        self.cache = _RateCache(maxsize=64)  # Bounded by distinct base currencies
         self.cache_timeout = 3600  # 1 hour in seconds
+        self.request_timeout = (3.05, 10)  # (connect, read) in seconds
+        
+        # Reuse one pooled connection to the API instead of a fresh
+        # TCP + TLS handshake on every cache miss
+        self.session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries)
+        )
+        
+        # Base currencies most callers need, preloaded by warmup()
+        self.warmup_bases = ("USD", "EUR", "GBP")
+        
+        # Per-base [lock, users] so concurrent cache misses trigger a single
+        # fetch; entries are dropped once no thread needs them
+        self._fetch_locks = {}
+        self._fetch_locks_guard = threading.Lock()
+        
+        # Optional on-disk copy of the cache so restarts skip the fetch
+        self._disk = None
+        self._disk_lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._open_disk_cache(os.path.join(cache_dir, "rates"))
+        
+        # Created in __aenter__ for the async API, depending on backend
+        self._aiosession = None
+        self._client = None
+        # In-flight async fetches keyed by base currency
+        self._inflight = {}
+        
+    def close(self) -> None:
+        """Release the HTTP session and the on-disk cache"""
+        self.session.close()
+        with self._disk_lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+        
+    async def __aenter__(self):
+        if self.backend == "httpx":
+            if self._client is None:
+                # One connection multiplexes concurrent requests over HTTP/2
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=10.0,
+                    limits=httpx.Limits(max_keepalive_connections=10)
+                )
+        elif self._aiosession is None:
+            self._aiosession = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        
+    async def aclose(self) -> None:
+        """Release the async HTTP client as well as everything close() does"""
+        if self._aiosession is not None:
+            await self._aiosession.close()
+            self._aiosession = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
         
     def get_exchange_rates(self, base_currency: str = "USD") -> Dict:
         """
@@ -57,23 +250,44 @@ class CurrencyConverter:
         """
         try:
             # Check cache first
-            cache_key = f"{base_currency}_{datetime.now().hour}"
-            if cache_key in self.cache:
-                logger.info(f"Using cached rates for {base_currency}")
-                return self.cache[cache_key]
-            
-            # Make API request
-            response = requests.get(f"{self.base_url}/{base_currency}")
-            response.raise_for_status()
+            cached = self._get_cached(base_currency)
+            if cached is not None:
+                logger.info("Using cached rates for %s", base_currency)
+                return cached
             
-            data = response.json()
-            self.cache[cache_key] = data
-            logger.info(f"Successfully fetched rates for {base_currency}")
-            
-            return data
+            # Only one thread fetches a given base; the others wait for it
+            with self._fetch_lock(base_currency):
+                cached = self._get_cached(base_currency)
+                if cached is not None:
+                    return cached
+                
+                # Make API request, revalidating any expired entry still held
+                headers = self._conditional_headers(base_currency)
+                response = self.session.get(
+                    f"{self.base_url}/{base_currency}",
+                    headers=headers,
+                    timeout=self.request_timeout
+                )
+                if response.status_code == 304:
+                    data = self._renew_cached(base_currency, headers)
+                    if data is None:
+                        raise requests.exceptions.HTTPError(
+                            f"304 Not Modified for {base_currency} "
+                            "without a cached entry",
+                            response=response
+                        )
+                    logger.info("Rates for %s not modified", base_currency)
+                    return data
+                response.raise_for_status()
+                
+                data = _parse_json(response.content)
+                self._set_cached(base_currency, data, response.headers)
+                logger.info("Successfully fetched rates for %s", base_currency)
+                
+                return data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching exchange rates: {e}")
+            logger.error("Error fetching exchange rates: %s", e)
             raise
             
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
@@ -88,65 +302,566 @@ class CurrencyConverter:
         Returns:
             Converted amount
         """
+        # Same-currency conversions need no rates at all
+        if from_currency == to_currency:
+            return _round_money(amount)
+        
         try:
             # Get exchange rates
-            rates_data = self.get_exchange_rates(from_currency)
-            rates = rates_data.get('rates', {})
+            rates = self._get_rates(from_currency)
+            return self._apply_rate(rates, amount, from_currency, to_currency)
             
-            if to_currency not in rates:
-                raise ValueError(f"Currency {to_currency} not supported")
-                
-            converted_amount = amount * rates[to_currency]
+        except Exception as e:
+            logger.error("Conversion error: %s", e)
+            raise
+            
+    def cross(self, amount: float, from_currency: str, to_currency: str,
+              via: str = "USD") -> float:
+        """
+        Convert amount using cross rates derived from a third currency
+        
+        A single payload for via prices every pair, e.g.
+        GBP->JPY = rates[JPY] / rates[GBP] with USD as via.
+        
+        Args:
+            amount: Amount to convert
+            from_currency: Source currency code
+            to_currency: Target currency code
+            via: Base currency whose rates are used (default: USD)
+            
+        Returns:
+            Converted amount
+        """
+        try:
+            rates = self._get_rates(via)
+            return self._apply_cross_rate(
+                rates, amount, from_currency, to_currency, via
+            )
+            
+        except Exception as e:
+            logger.error("Conversion error: %s", e)
+            raise
+            
+    async def across(self, amount: float, from_currency: str, to_currency: str,
+                     via: str = "USD") -> float:
+        """
+        Async counterpart of cross
+        
+        Args:
+            amount: Amount to convert
+            from_currency: Source currency code
+            to_currency: Target currency code
+            via: Base currency whose rates are used (default: USD)
             
-            logger.info(
-                f"Converted {amount} {from_currency} to "
-                f"{converted_amount:.2f} {to_currency}"
+        Returns:
+            Converted amount
+        """
+        try:
+            rates = await self._aget_rates(via)
+            return self._apply_cross_rate(
+                rates, amount, from_currency, to_currency, via
             )
             
-            return round(converted_amount, 2)
+        except Exception as e:
+            logger.error("Conversion error: %s", e)
+            raise
+            
+    def convert_many(self, pairs: List[Tuple[float, str, str]]) -> List[float]:
+        """
+        Convert several amounts, fetching each base currency only once
+        
+        Args:
+            pairs: (amount, from_currency, to_currency) tuples
+            
+        Returns:
+            Converted amounts in the same order as pairs
+        """
+        try:
+            results = [0.0] * len(pairs)
+            groups = defaultdict(list)
+            for index, (amount, from_currency, to_currency) in enumerate(pairs):
+                if from_currency == to_currency:
+                    results[index] = _round_money(amount)
+                else:
+                    groups[from_currency].append((index, amount, to_currency))
+            
+            for from_currency, items in groups.items():
+                rates = self._get_rates(from_currency)
+                for index, amount, to_currency in items:
+                    results[index] = self._apply_rate(
+                        rates, amount, from_currency, to_currency
+                    )
+            
+            return results
+            
+        except Exception as e:
+            logger.error("Conversion error: %s", e)
+            raise
+            
+    def warmup(self, bases: Optional[Iterable[str]] = None) -> None:
+        """
+        Preload the cache for several base currencies concurrently
+        
+        Failures are logged rather than raised; convert() simply
+        fetches those bases again on demand.
+        
+        Args:
+            bases: Base currency codes to fetch (default: warmup_bases)
+        """
+        bases = self._warmup_list(bases)
+        if not bases:
+            return
+        workers = min(len(bases), _MAX_WARMUP_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.get_exchange_rates, base) for base in bases
+            ]
+        self._log_warmup_failures(
+            bases, [future.exception() for future in futures]
+        )
+            
+    async def aget_exchange_rates(self, base_currency: str = "USD") -> Dict:
+        """
+        Fetch current exchange rates without blocking the event loop
+        
+        Shares its cache with get_exchange_rates. Must be used inside
+        ``async with CurrencyConverter() as converter``.
+        
+        Args:
+            base_currency: The base currency code (default: USD)
+            
+        Returns:
+            Dictionary of exchange rates
+        """
+        try:
+            # Check cache first
+            cached = self._get_cached(base_currency)
+            if cached is not None:
+                logger.info("Using cached rates for %s", base_currency)
+                return cached
+            
+            # Concurrent callers for the same base share one in-flight request
+            task = self._inflight.get(base_currency)
+            if task is None:
+                task = asyncio.ensure_future(self._aload_rates(base_currency))
+                self._inflight[base_currency] = task
+                task.add_done_callback(
+                    lambda _: self._inflight.pop(base_currency, None)
+                )
+            # Shield so one cancelled caller does not cancel the shared fetch
+            return await asyncio.shield(task)
+            
+        except _ASYNC_HTTP_ERRORS as e:
+            logger.error("Error fetching exchange rates: %s", e)
+            raise
+            
+    async def _aload_rates(self, base_currency: str) -> Dict:
+        """Fetch rates for base_currency over aiohttp and cache them"""
+        sent_headers = self._conditional_headers(base_currency)
+        data, headers = await self._afetch(base_currency, sent_headers)
+        if data is None:
+            data = self._renew_cached(base_currency, sent_headers)
+            if data is None:
+                # Raise the active backend's own transport error
+                error = (httpx.HTTPError if self._client is not None
+                         else aiohttp.ClientError)
+                raise error(
+                    f"304 Not Modified for {base_currency} without a cached entry"
+                )
+            logger.info("Rates for %s not modified", base_currency)
+            return data
+        self._set_cached(base_currency, data, headers)
+        logger.info("Successfully fetched rates for %s", base_currency)
+        
+        return data
+            
+    async def awarmup(self, bases: Optional[Iterable[str]] = None) -> None:
+        """
+        Async counterpart of warmup
+        
+        Args:
+            bases: Base currency codes to fetch (default: warmup_bases)
+        """
+        bases = self._warmup_list(bases)
+        results = await asyncio.gather(
+            *(self.aget_exchange_rates(base) for base in bases),
+            return_exceptions=True
+        )
+        self._log_warmup_failures(
+            bases, [r if isinstance(r, Exception) else None for r in results]
+        )
+            
+    async def aconvert(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """
+        Async counterpart of convert, suitable for asyncio.gather
+        
+        Args:
+            amount: Amount to convert
+            from_currency: Source currency code
+            to_currency: Target currency code
+            
+        Returns:
+            Converted amount
+        """
+        if from_currency == to_currency:
+            return _round_money(amount)
+        
+        try:
+            rates = await self._aget_rates(from_currency)
+            return self._apply_rate(rates, amount, from_currency, to_currency)
             
         except Exception as e:
-            logger.error(f"Conversion error: {e}")
+            logger.error("Conversion error: %s", e)
             raise
             
+    def _warmup_list(self, bases: Optional[Iterable[str]]) -> List[str]:
+        """Return the distinct bases to warm, defaulting to warmup_bases"""
+        if bases is None:
+            bases = self.warmup_bases
+        return list(dict.fromkeys(bases))
+    
+    def _log_warmup_failures(self, bases: List[str],
+                             errors: List[Optional[BaseException]]) -> None:
+        """Log bases whose warmup fetch raised"""
+        for base, error in zip(bases, errors):
+            if error is not None:
+                logger.warning("Warmup failed for %s: %s", base, error)
+    
+    @contextmanager
+    def _fetch_lock(self, base_currency: str) -> Iterator[None]:
+        """Hold the lock serialising fetches of base_currency"""
+        with self._fetch_locks_guard:
+            slot = self._fetch_locks.get(base_currency)
+            if slot is None:
+                slot = self._fetch_locks[base_currency] = [threading.Lock(), 0]
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._fetch_locks_guard:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._fetch_locks[base_currency]
+    
+    def _get_fresh_entry(self, base_currency: str) -> Optional[Dict]:
+        """Return the cache entry for base_currency if it has not expired"""
+        entry = self.cache.get(base_currency)
+        if entry and entry["exp"] > time.monotonic():
+            return entry
+        return None
+    
+    def _get_cached(self, base_currency: str) -> Optional[Dict]:
+        """Return cached rates payload for base_currency if not expired"""
+        entry = self._get_fresh_entry(base_currency)
+        return entry["data"] if entry else None
+    
+    def _set_cached(self, base_currency: str, data: Dict,
+                    headers: Optional[Mapping] = None) -> None:
+        """Cache rates for base_currency for cache_timeout seconds"""
+        headers = headers or {}
+        entry = self._store_entry(
+            base_currency, data, headers.get("ETag"),
+            headers.get("Last-Modified"), self.cache_timeout
+        )
+        self._save_to_disk(base_currency, entry)
+    
+    def _store_entry(self, base_currency: str, data: Dict, etag: Optional[str],
+                     last_modified: Optional[str], ttl: float) -> Dict:
+        """Put a rates payload in the in-memory cache for ttl seconds"""
+        rates = data.get('rates', {})
+        entry = {
+            "data": data,
+            # Inner mapping kept alongside the payload for the convert hot path
+            "rates": rates,
+            "codes": frozenset(rates),
+            # Validators for conditional requests once the entry expires
+            "etag": etag,
+            "last_modified": last_modified,
+            "exp": time.monotonic() + ttl
+        }
+        self.cache[base_currency] = entry
+        return entry
+    
+    def _renew_cached(self, base_currency: str,
+                      sent_headers: Mapping[str, str]) -> Optional[Dict]:
+        """
+        Extend the TTL of an entry the API reported as not modified
+        
+        Returns None when the 304 cannot refer to a cached entry: no
+        validators were sent, or the entry was evicted mid-request.
+        """
+        entry = self.cache.get(base_currency)
+        if not sent_headers or entry is None:
+            return None
+        entry["exp"] = time.monotonic() + self.cache_timeout
+        self._save_to_disk(base_currency, entry)
+        return entry["data"]
+    
+    def _open_disk_cache(self, path: str) -> None:
+        """Open the on-disk cache, falling back to memory only if unreadable"""
+        try:
+            self._disk = shelve.open(path)
+        except _DISK_CACHE_ERRORS as e:
+            logger.warning("Ignoring unreadable rates cache %s: %s", path, e)
+            self._disk = None
+            return
+        self._load_from_disk()
+    
+    def _load_from_disk(self) -> None:
+        """
+        Copy every persisted entry into the in-memory cache once at open
+        
+        Lookups then never touch the disk. Expired entries are loaded too
+        so their validators can be used for a conditional request.
+        Unreadable records are skipped and overwritten on the next fetch.
+        """
+        records = []
+        with self._disk_lock:
+            try:
+                keys = list(self._disk.keys())
+            except _DISK_CACHE_ERRORS as e:
+                logger.warning("Ignoring unreadable rates cache: %s", e)
+                return
+            for base_currency in keys:
+                try:
+                    record = self._disk[base_currency]
+                    records.append((
+                        float(record["expires_at"]), base_currency,
+                        record["data"], record["etag"], record["last_modified"]
+                    ))
+                except _DISK_CACHE_ERRORS as e:
+                    logger.warning(
+                        "Skipping unreadable cached rates for %s: %s",
+                        base_currency, e
+                    )
+        # Oldest first, so the LRU cap keeps the freshest entries
+        records.sort(key=lambda record: record[0])
+        now = time.time()
+        for expires_at, base_currency, data, etag, last_modified in records:
+            # Persisted expiry is wall-clock time; monotonic time is per process
+            self._store_entry(
+                base_currency, data, etag, last_modified, expires_at - now
+            )
+    
+    def _save_to_disk(self, base_currency: str, entry: Dict) -> None:
+        """Persist a cache entry if an on-disk cache is configured"""
+        with self._disk_lock:
+            if self._disk is None:
+                return
+            try:
+                self._disk[base_currency] = {
+                    "data": entry["data"],
+                    "etag": entry["etag"],
+                    "last_modified": entry["last_modified"],
+                    "expires_at": time.time() + entry["exp"] - time.monotonic()
+                }
+            except _DISK_CACHE_ERRORS as e:
+                # The in-memory cache still holds the entry
+                logger.warning(
+                    "Could not persist rates for %s: %s", base_currency, e
+                )
+    
+    def _conditional_headers(self, base_currency: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a stale entry"""
+        headers = {}
+        entry = self.cache.get(base_currency)
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def _get_rates(self, base_currency: str) -> Dict[str, float]:
+        """Return the rates mapping for base_currency, fetching if needed"""
+        entry = self._get_fresh_entry(base_currency)
+        if entry:
+            return entry["rates"]
+        return self.get_exchange_rates(base_currency).get('rates', {})
+    
+    def _get_codes(self, base_currency: str = "USD") -> frozenset:
+        """Return the set of currency codes quoted against base_currency"""
+        entry = self._get_fresh_entry(base_currency)
+        if entry:
+            return entry["codes"]
+        return frozenset(self.get_exchange_rates(base_currency).get('rates', {}))
+    
+    def _get_any_codes(self) -> frozenset:
+        """
+        Return supported currency codes from any fresh cache entry
+        
+        Every base's payload quotes the same currencies, so a warm EUR
+        entry answers as well as USD without another request.
+        """
+        codes = self._get_warm_codes()
+        if codes is not None:
+            return codes
+        return self._get_codes()
+    
+    def _get_warm_codes(self) -> Optional[frozenset]:
+        """Return currency codes from any fresh cache entry, else None"""
+        now = time.monotonic()
+        for entry in list(self.cache.values()):
+            if entry["exp"] > now:
+                return entry["codes"]
+        return None
+    
+    async def _aget_rates(self, base_currency: str) -> Dict[str, float]:
+        """Async counterpart of _get_rates"""
+        entry = self._get_fresh_entry(base_currency)
+        if entry:
+            return entry["rates"]
+        return (await self.aget_exchange_rates(base_currency)).get('rates', {})
+            
+    async def _afetch(self, base_currency: str,
+                      headers: Mapping[str, str]) -> Tuple[Optional[Dict], Mapping]:
+        """
+        Request the rates payload for one base currency asynchronously
+        
+        Args:
+            base_currency: The base currency code
+            headers: Request headers, e.g. conditional request validators
+            
+        Returns:
+            (payload, response headers); payload is None on 304 Not Modified
+        """
+        url = f"{self.base_url}/{base_currency}"
+        
+        if self._client is not None:
+            response = await self._client.get(url, headers=headers)
+            if response.status_code == 304:
+                return None, response.headers
+            response.raise_for_status()
+            return _parse_json(response.content), response.headers
+        
+        if self._aiosession is None:
+            raise RuntimeError(
+                "Async API requires 'async with CurrencyConverter() as converter'"
+            )
+        async with self._aiosession.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, response.headers
+            response.raise_for_status()
+            return _parse_json(await response.read()), response.headers
+            
+    def _apply_cross_rate(self, rates: Dict[str, float], amount: float,
+                          from_currency: str, to_currency: str, via: str) -> float:
+        """Convert amount through the already fetched rates of via"""
+        from_rate = 1.0 if from_currency == via else rates.get(from_currency)
+        if from_rate is None:
+            raise ValueError(f"Currency {from_currency} not supported")
+        to_rate = 1.0 if to_currency == via else rates.get(to_currency)
+        if to_rate is None:
+            raise ValueError(f"Currency {to_currency} not supported")
+            
+        converted_amount = amount * to_rate / from_rate
+        
+        logger.info(
+            "Converted %s %s to %.2f %s via %s",
+            amount, from_currency, converted_amount, to_currency, via
+        )
+        
+        return _round_money(converted_amount)
+    
+    def _apply_rate(self, rates: Dict[str, float], amount: float,
+                    from_currency: str, to_currency: str) -> float:
+        """Convert amount using an already fetched rates mapping"""
+        rate = rates.get(to_currency)
+        if rate is None:
+            raise ValueError(f"Currency {to_currency} not supported")
+            
+        converted_amount = amount * rate
+        
+        logger.info(
+            "Converted %s %s to %.2f %s",
+            amount, from_currency, converted_amount, to_currency
+        )
+        
+        return _round_money(converted_amount)
+            
     def get_supported_currencies(self) -> list:
-        """Get list of supported currencies"""
+        """Get sorted list of supported currencies"""
         try:
-            data = self.get_exchange_rates()
-            return list(data.get('rates', {}).keys())
+            return sorted(self._get_any_codes())
         except Exception as e:
-            logger.error(f"Error fetching supported currencies: {e}")
+            logger.error("Error fetching supported currencies: %s", e)
             return []
+            
+    async def aget_supported_currencies(self) -> list:
+        """Async counterpart of get_supported_currencies"""
+        try:
+            codes = self._get_warm_codes()
+            if codes is None:
+                data = await self.aget_exchange_rates()
+                codes = data.get('rates', {})
+            return sorted(codes)
+        except Exception as e:
+            logger.error("Error fetching supported currencies: %s", e)
+            return []
+            
+    def is_supported(self, currency_code: str) -> bool:
+        """
+        Check whether a currency code is supported
+        
+        Prefer this over ``code in get_supported_currencies()`` for
+        repeated checks; it is a single set lookup.
+        
+        Args:
+            currency_code: Currency code to check
+            
+        Returns:
+            True if rates are available for the currency
+        """
+        try:
+            return currency_code in self._get_any_codes()
+        except Exception as e:
+            logger.error("Error fetching supported currencies: %s", e)
+            return False
 
 
-def main():
+async def main():
     """Main function to demonstrate the currency converter"""
-    converter = CurrencyConverter()
-    
-    # Example conversions
-    conversions = [
-        (100, "USD", "EUR"),
-        (50, "GBP", "JPY"),
-        (1000, "EUR", "USD")
-    ]
+    conversions = DEMO_CONVERSIONS
     
     print("Currency Converter Automation Script")
     print("=" * 40)
     
-    for amount, from_curr, to_curr in conversions:
-        try:
-            result = converter.convert(amount, from_curr, to_curr)
-            print(f"{amount} {from_curr} = {result} {to_curr}")
-        except Exception as e:
-            print(f"Error converting {from_curr} to {to_curr}: {e}")
-    
-    # Show supported currencies
-    print("\nSupported currencies:")
-    currencies = converter.get_supported_currencies()
-    print(", ".join(currencies[:10]) + "...")
+    # Rates persist on disk, so reruns within the cache timeout skip the API
+    converter = CurrencyConverter(cache_dir=DEFAULT_CACHE_DIR)
+    try:
+        async with converter:
+            # One USD fetch prices every pair, including the cross rate
+            await converter.awarmup(["USD"])
+            
+            results = await asyncio.gather(
+                *(converter.aconvert(amount, from_curr, to_curr)
+                  for amount, from_curr, to_curr in conversions),
+                return_exceptions=True
+            )
+            
+            for (amount, from_curr, to_curr), result in zip(conversions, results):
+                if isinstance(result, Exception):
+                    print(f"Error converting {from_curr} to {to_curr}: {result}")
+                else:
+                    print(f"{amount} {from_curr} = {result} {to_curr}")
+            
+            amount, from_curr, to_curr = DEMO_CROSS_CONVERSION
+            try:
+                result = await converter.across(
+                    amount, from_curr, to_curr, via="USD"
+                )
+                print(f"{amount} {from_curr} = {result} {to_curr} (via USD)")
+            except Exception as e:
+                print(f"Error converting {from_curr} to {to_curr}: {e}")
+            
+            # Show supported currencies
+            print("\nSupported currencies:")
+            currencies = await converter.aget_supported_currencies()
+            print(", ".join(currencies[:10]) + "...")
+    finally:
+        converter.close()
 
 
 if __name__ == "__main__":
-    main()
-    
-    
\ No newline at end of file
+    asyncio.run(main())
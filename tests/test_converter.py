@@ -1,7 +1,17 @@
+import aiohttp
+import asyncio
+import dbm
+import json
+import math
 import pytest
-from unittest.mock import patch, Mock
+import requests
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 import sys
 import os
+import pickle
+import shelve
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path so we can import our module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -9,6 +19,28 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from currency_converter import CurrencyConverter
 
 
+def mock_http_response(payload):
+    """Build a requests-style response whose body is payload as JSON"""
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.raise_for_status.return_value = None
+    return response
+
+
+def mock_aio_response(payload):
+    """Build an async context manager mimicking aiohttp's response"""
+    response = MagicMock()
+    response.status = 200
+    response.headers = {}
+    response.raise_for_status.return_value = None
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    context = MagicMock()
+    context.__aenter__.return_value = response
+    return context
+
+
 class TestCurrencyConverter:
     """Test suite for CurrencyConverter class"""
     
@@ -40,24 +72,26 @@ class TestCurrencyConverter:
         assert converter.base_url == "https://api.exchangerate-api.com/v4/latest"
         assert converter.cache == {}
         assert converter.cache_timeout == 3600
+        assert isinstance(converter.session, requests.Session)
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_get_exchange_rates_success(self, mock_get, converter, mock_api_response):
         """Test successful API call"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # Call method
         result = converter.get_exchange_rates("USD")
         
         # Assertions
         assert result == mock_api_response
-        mock_get.assert_called_once_with("https://api.exchangerate-api.com/v4/latest/USD")
+        mock_get.assert_called_once_with(
+            "https://api.exchangerate-api.com/v4/latest/USD",
+            headers={},
+            timeout=converter.request_timeout
+        )
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_get_exchange_rates_api_error(self, mock_get, converter):
         """Test API error handling"""
         # Setup mock to raise an exception
@@ -69,14 +103,11 @@ class TestCurrencyConverter:
         
         assert "API Error" in str(exc_info.value)
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_convert_success(self, mock_get, converter, mock_api_response):
         """Test successful currency conversion"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # Test conversion
         result = converter.convert(100, "USD", "EUR")
@@ -84,14 +115,11 @@ class TestCurrencyConverter:
         # Should be 100 * 0.85 = 85.0
         assert result == 85.0
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_convert_with_decimals(self, mock_get, converter, mock_api_response):
         """Test conversion with decimal amounts"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # Test conversion with decimals
         result = converter.convert(99.99, "USD", "GBP")
@@ -99,14 +127,11 @@ class TestCurrencyConverter:
         # Should be 99.99 * 0.73 = 72.99 (rounded to 2 decimals)
         assert result == 72.99
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_convert_invalid_currency(self, mock_get, converter, mock_api_response):
         """Test conversion with invalid currency"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # Should raise ValueError for invalid currency
         with pytest.raises(ValueError) as exc_info:
@@ -114,14 +139,11 @@ class TestCurrencyConverter:
         
         assert "Currency INVALID not supported" in str(exc_info.value)
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_caching_mechanism(self, mock_get, converter, mock_api_response):
         """Test that caching prevents duplicate API calls"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # First call
         result1 = converter.get_exchange_rates("USD")
@@ -132,25 +154,182 @@ class TestCurrencyConverter:
         assert result1 == result2
         # API should only be called once due to caching
         assert mock_get.call_count == 1
+        # The inner rates mapping is cached alongside the payload
+        assert converter.cache["USD"]["rates"] is result1["rates"]
+    
+    @patch('currency_converter.time.monotonic')
+    @patch('currency_converter.requests.Session.get')
+    def test_cache_expires_after_timeout(self, mock_get, mock_monotonic,
+                                         converter, mock_api_response):
+        """Test that cached rates are refetched only once the TTL elapses"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        mock_monotonic.return_value = 1000.0
+        converter.get_exchange_rates("USD")
+        
+        # Still fresh just before the timeout
+        mock_monotonic.return_value = 1000.0 + converter.cache_timeout - 1
+        converter.get_exchange_rates("USD")
+        assert mock_get.call_count == 1
+        
+        # Expired once the timeout has passed
+        mock_monotonic.return_value = 1000.0 + converter.cache_timeout + 1
+        converter.get_exchange_rates("USD")
+        assert mock_get.call_count == 2
+    
+    @patch('currency_converter.time.monotonic')
+    @patch('currency_converter.requests.Session.get')
+    def test_expired_cache_revalidated_with_etag(self, mock_get, mock_monotonic,
+                                                 converter, mock_api_response):
+        """Test a 304 response keeps the cached payload and renews its TTL"""
+        fresh = mock_http_response(mock_api_response)
+        fresh.headers = {"ETag": '"abc123"'}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+        
+        mock_monotonic.return_value = 1000.0
+        converter.get_exchange_rates("USD")
+        
+        mock_monotonic.return_value = 1000.0 + converter.cache_timeout + 1
+        result = converter.get_exchange_rates("USD")
+        
+        assert result == mock_api_response
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc123"'}
+        assert converter.cache["USD"]["exp"] > mock_monotonic.return_value
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_unexpected_not_modified(self, mock_get, converter):
+        """Test a 304 without a cached entry raises a requests error"""
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.return_value = not_modified
+        
+        with pytest.raises(requests.exceptions.HTTPError):
+            converter.get_exchange_rates("USD")
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_disk_cache_survives_restart(self, mock_get, tmp_path,
+                                         mock_api_response):
+        """Test rates persisted by one converter are reused by the next"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        first = CurrencyConverter(cache_dir=str(tmp_path))
+        first.get_exchange_rates("USD")
+        first.close()
+        
+        second = CurrencyConverter(cache_dir=str(tmp_path))
+        try:
+            assert second.convert(100, "USD", "EUR") == 85.0
+        finally:
+            second.close()
+        assert mock_get.call_count == 1
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
+    def test_disk_cache_loaded_once(self, mock_get, tmp_path, mock_api_response):
+        """Test lookups are served from memory once the shelf is loaded"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        first = CurrencyConverter(cache_dir=str(tmp_path))
+        first.get_exchange_rates("USD")
+        first.close()
+        
+        second = CurrencyConverter(cache_dir=str(tmp_path))
+        try:
+            assert "USD" in second.cache
+            with patch.object(second, '_disk') as mock_disk:
+                second.convert(100, "USD", "EUR")
+                assert mock_disk.get.call_count == 0
+        finally:
+            second.close()
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_corrupted_disk_cache(self, mock_get, tmp_path, mock_api_response):
+        """Test unreadable records are skipped instead of failing startup"""
+        path = str(tmp_path / "rates")
+        with shelve.open(path) as shelf:
+            shelf["USD"] = {
+                "data": mock_api_response,
+                "etag": None,
+                "last_modified": None,
+                "expires_at": time.time() + 3600
+            }
+            # Written by an older or interrupted run
+            shelf["EUR"] = {"data": mock_api_response, "expires_at": 0}
+        with dbm.open(path, "w") as db:
+            db[b"GBP"] = pickle.dumps(mock_api_response)[:10]
+        
+        converter = CurrencyConverter(cache_dir=str(tmp_path))
+        try:
+            assert list(converter.cache) == ["USD"]
+            assert converter.convert(100, "USD", "EUR") == 85.0
+        finally:
+            converter.close()
+        assert mock_get.call_count == 0
+    
+    @patch('currency_converter.shelve.open')
+    def test_unopenable_disk_cache(self, mock_open, tmp_path):
+        """Test a shelf that cannot be opened leaves a memory-only cache"""
+        mock_open.side_effect = dbm.error[0]("db type could not be determined")
+        
+        converter = CurrencyConverter(cache_dir=str(tmp_path))
+        
+        assert converter._disk is None
+        assert len(converter.cache) == 0
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_disk_cache_expires(self, mock_get, tmp_path, mock_api_response):
+        """Test expired persisted rates are revalidated with the API"""
+        fresh = mock_http_response(mock_api_response)
+        fresh.headers = {"ETag": '"abc123"'}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [fresh, not_modified]
+        
+        first = CurrencyConverter(cache_dir=str(tmp_path))
+        first.cache_timeout = -1  # Persist an already expired entry
+        first.get_exchange_rates("USD")
+        first.close()
+        
+        second = CurrencyConverter(cache_dir=str(tmp_path))
+        try:
+            assert second.get_exchange_rates("USD") == mock_api_response
+        finally:
+            second.close()
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc123"'}
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_cache_evicts_least_recently_used(self, mock_get, converter,
+                                              mock_api_response):
+        """Test that the cache never grows beyond its size limit"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        converter.cache.maxsize = 2
+        
+        converter.get_exchange_rates("USD")
+        converter.get_exchange_rates("EUR")
+        # Touch USD so EUR becomes the least recently used entry
+        converter.get_exchange_rates("USD")
+        converter.get_exchange_rates("GBP")
+        
+        assert len(converter.cache) == 2
+        assert "USD" in converter.cache
+        assert "EUR" not in converter.cache
+        assert mock_get.call_count == 3
+    
+    @patch('currency_converter.requests.Session.get')
     def test_different_base_currencies(self, mock_get, converter):
         """Test using different base currencies"""
         # Setup different responses for different currencies
-        def side_effect(url):
-            mock_response = Mock()
+        def side_effect(url, **kwargs):
             if "EUR" in url:
-                mock_response.json.return_value = {
+                return mock_http_response({
                     "base": "EUR",
                     "rates": {"USD": 1.18, "GBP": 0.86}
-                }
-            else:
-                mock_response.json.return_value = {
-                    "base": "USD",
-                    "rates": {"EUR": 0.85, "GBP": 0.73}
-                }
-            mock_response.raise_for_status.return_value = None
-            return mock_response
+                })
+            return mock_http_response({
+                "base": "USD",
+                "rates": {"EUR": 0.85, "GBP": 0.73}
+            })
         
         mock_get.side_effect = side_effect
         
@@ -162,14 +341,125 @@ class TestCurrencyConverter:
         assert eur_rates["base"] == "EUR"
         assert mock_get.call_count == 2
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
+    def test_convert_many(self, mock_get, converter):
+        """Test batch conversion fetches each base currency once"""
+        def side_effect(url, **kwargs):
+            if "EUR" in url:
+                return mock_http_response({
+                    "base": "EUR",
+                    "rates": {"USD": 1.18, "GBP": 0.86}
+                })
+            return mock_http_response({
+                "base": "USD",
+                "rates": {"EUR": 0.85, "GBP": 0.73}
+            })
+        
+        mock_get.side_effect = side_effect
+        
+        results = converter.convert_many([
+            (100, "USD", "EUR"),
+            (10, "EUR", "USD"),
+            (200, "USD", "GBP")
+        ])
+        
+        # Results keep the input order
+        assert results == [85.0, 11.8, 146.0]
+        assert mock_get.call_count == 2
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_warmup_preloads_cache(self, mock_get, converter, mock_api_response):
+        """Test warmup fetches each base so later conversions hit the cache"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        converter.warmup(["USD", "EUR", "GBP"])
+        assert mock_get.call_count == 3
+        
+        converter.convert(100, "EUR", "JPY")
+        assert mock_get.call_count == 3
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_warmup_bases_explicit(self, mock_get, converter, mock_api_response):
+        """Test an empty list warms nothing and duplicates are fetched once"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        converter.warmup([])
+        assert mock_get.call_count == 0
+        
+        converter.warmup(["USD", "USD", "EUR"])
+        assert mock_get.call_count == 2
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_warmup_tolerates_errors(self, mock_get, converter):
+        """Test a failed warmup fetch does not raise"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+        
+        converter.warmup(["USD"])
+        assert len(converter.cache) == 0
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_concurrent_threads_share_one_fetch(self, mock_get, converter,
+                                                mock_api_response):
+        """Test threads missing the cache at once issue a single fetch"""
+        def slow_get(url, **kwargs):
+            time.sleep(0.05)
+            return mock_http_response(mock_api_response)
+        
+        mock_get.side_effect = slow_get
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for _ in range(5):
+                executor.submit(converter.get_exchange_rates, "USD")
+        assert mock_get.call_count == 1
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_cross_rate(self, mock_get, converter, mock_api_response):
+        """Test triangulating a pair from another base's rates"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        # 50 GBP -> JPY = 50 * 110.0 / 0.73
+        assert converter.cross(50, "GBP", "JPY") == 7534.25
+        assert converter.cross(100, "EUR", "USD") == 117.65
+        assert mock_get.call_count == 1
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_convert_does_not_depend_on_cached_bases(self, mock_get, converter):
+        """Test convert and convert_many agree whatever else is cached"""
+        def side_effect(url, **kwargs):
+            if "GBP" in url:
+                return mock_http_response({
+                    "base": "GBP",
+                    "rates": {"JPY": 150.0}
+                })
+            return mock_http_response({
+                "base": "USD",
+                "rates": {"GBP": 0.73, "JPY": 110.0}
+            })
+        
+        mock_get.side_effect = side_effect
+        converter.get_exchange_rates("USD")
+        
+        # Cached USD rates are only used for cross rates when asked for
+        assert converter.convert(50, "GBP", "JPY") == 7500.0
+        assert converter.convert_many([(50, "GBP", "JPY")]) == [7500.0]
+        assert converter.cross(50, "GBP", "JPY") == 7534.25
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_fetch_locks_released(self, mock_get, converter):
+        """Test per-base fetch locks do not accumulate after fetches"""
+        mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        
+        for i in range(20):
+            with pytest.raises(requests.exceptions.HTTPError):
+                converter.get_exchange_rates(f"B{i}")
+        
+        assert converter._fetch_locks == {}
+    
+    @patch('currency_converter.requests.Session.get')
     def test_get_supported_currencies(self, mock_get, converter, mock_api_response):
         """Test getting list of supported currencies"""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_http_response(mock_api_response)
         
         # Get supported currencies
         currencies = converter.get_supported_currencies()
@@ -180,31 +470,48 @@ class TestCurrencyConverter:
         assert "GBP" in currencies
         assert "JPY" in currencies
         assert len(currencies) == 8  # Based on our mock data
+        # Returned in a stable, sorted order
+        assert currencies == sorted(currencies)
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_supported_currencies_reuse_cached_base(self, mock_get, converter,
+                                                    mock_api_response):
+        """Test supported currencies come from any warm base without a fetch"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        converter.get_exchange_rates("EUR")
+        
+        currencies = converter.get_supported_currencies()
+        
+        assert len(currencies) == 8
+        assert mock_get.call_count == 1
+    
+    @patch('currency_converter.requests.Session.get')
+    def test_is_supported(self, mock_get, converter, mock_api_response):
+        """Test membership checks against the cached currency codes"""
+        mock_get.return_value = mock_http_response(mock_api_response)
+        
+        assert converter.is_supported("EUR")
+        assert not converter.is_supported("INVALID")
+        assert mock_get.call_count == 1
     
     def test_convert_zero_amount(self, converter):
         """Test converting zero amount"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
+        with patch('currency_converter.requests.Session.get') as mock_get:
+            mock_get.return_value = mock_http_response({
                 "base": "USD",
                 "rates": {"EUR": 0.85}
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+            })
             
             result = converter.convert(0, "USD", "EUR")
             assert result == 0.0
     
     def test_convert_large_amount(self, converter):
         """Test converting large amounts"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
+        with patch('currency_converter.requests.Session.get') as mock_get:
+            mock_get.return_value = mock_http_response({
                 "base": "USD",
                 "rates": {"EUR": 0.85}
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+            })
             
             result = converter.convert(1000000, "USD", "EUR")
             assert result == 850000.0
@@ -218,21 +525,45 @@ class TestEdgeCases:
     def converter(self):
         return CurrencyConverter()
     
+    @patch('currency_converter.requests.Session.get')
+    def test_rounding_half_cent(self, mock_get, converter):
+        """Test half-cent results round up instead of using binary round()"""
+        mock_get.return_value = mock_http_response({
+            "base": "USD",
+            "rates": {"XAU": 2.675}
+        })
+        
+        # round(2.675, 2) gives 2.67 because 2.675 is stored as 2.67499...
+        assert converter.convert(1, "USD", "XAU") == 2.68
+        assert converter.convert(-1, "USD", "XAU") == -2.68
+    
+    def test_rounding_unusual_values(self, converter):
+        """Test rounding accepts everything the built-in round() did"""
+        class ReprFloat(float):
+            # Mimics NumPy 2 scalars, whose repr is not a bare number
+            def __repr__(self):
+                return f"np.float64({float(self)})"
+        
+        assert converter.convert(float("inf"), "USD", "USD") == float("inf")
+        assert converter.convert(float("-inf"), "USD", "USD") == float("-inf")
+        assert math.isnan(converter.convert(float("nan"), "USD", "USD"))
+        assert converter.convert(ReprFloat(2.675), "USD", "USD") == 2.68
+        assert converter.convert(1e300, "USD", "USD") == 1e300
+    
     def test_same_currency_conversion(self, converter):
         """Test converting to the same currency"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
+        with patch('currency_converter.requests.Session.get') as mock_get:
+            mock_get.return_value = mock_http_response({
                 "base": "USD",
                 "rates": {"USD": 1.0}
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+            })
             
             result = converter.convert(100, "USD", "USD")
             assert result == 100.0
+            # No rates are needed, so no request is made
+            assert mock_get.call_count == 0
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_network_timeout(self, mock_get, converter):
         """Test handling network timeout"""
         import requests
@@ -241,16 +572,186 @@ class TestEdgeCases:
         with pytest.raises(requests.exceptions.Timeout):
             converter.get_exchange_rates("USD")
     
-    @patch('requests.get')
+    @patch('currency_converter.requests.Session.get')
     def test_invalid_json_response(self, mock_get, converter):
         """Test handling invalid JSON response"""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"<html>Invalid JSON</html>"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
         with pytest.raises(ValueError):
             converter.get_exchange_rates("USD")
+    
+    @patch('currency_converter.orjson', None)
+    @patch('currency_converter.requests.Session.get')
+    def test_stdlib_json_fallback(self, mock_get, converter):
+        """Test parsing still works when orjson is not installed"""
+        mock_get.return_value = mock_http_response({
+            "base": "USD",
+            "rates": {"EUR": 0.85}
+        })
+        
+        assert converter.convert(100, "USD", "EUR") == 85.0
+
+
+class TestAsyncConverter:
+    """Test the aiohttp-backed async API"""
+    
+    @pytest.fixture
+    def rates_by_base(self):
+        return {
+            "USD": {"base": "USD", "rates": {"EUR": 0.85, "JPY": 110.0}},
+            "GBP": {"base": "GBP", "rates": {"JPY": 150.0, "USD": 1.37}},
+            "EUR": {"base": "EUR", "rates": {"USD": 1.18}}
+        }
+    
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_aconvert_concurrent(self, mock_get, rates_by_base):
+        """Test converting several pairs concurrently"""
+        mock_get.side_effect = lambda url, **kwargs: mock_aio_response(
+            rates_by_base[url.rsplit("/", 1)[-1]]
+        )
+        
+        async def run():
+            async with CurrencyConverter() as converter:
+                return await asyncio.gather(
+                    converter.aconvert(100, "USD", "EUR"),
+                    converter.aconvert(50, "GBP", "JPY"),
+                    converter.aconvert(1000, "EUR", "USD")
+                )
+        
+        assert asyncio.run(run()) == [85.0, 7500.0, 1180.0]
+        assert mock_get.call_count == 3
+    
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_async_cache_shared_with_sync(self, mock_get, rates_by_base):
+        """Test that rates fetched asynchronously are reused synchronously"""
+        mock_get.return_value = mock_aio_response(rates_by_base["USD"])
+        converter = CurrencyConverter()
+        
+        async def run():
+            async with converter:
+                return await converter.aconvert(100, "USD", "EUR")
+        
+        assert asyncio.run(run()) == 85.0
+        with patch('currency_converter.requests.Session.get') as mock_sync_get:
+            assert converter.convert(1, "USD", "JPY") == 110.0
+            assert mock_sync_get.call_count == 0
+    
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_concurrent_misses_share_one_fetch(self, mock_get, rates_by_base):
+        """Test concurrent requests for a cold base issue a single fetch"""
+        mock_get.return_value = mock_aio_response(rates_by_base["USD"])
+        
+        async def run():
+            async with CurrencyConverter() as converter:
+                return await asyncio.gather(
+                    *(converter.aconvert(100, "USD", "EUR") for _ in range(5))
+                )
+        
+        assert asyncio.run(run()) == [85.0] * 5
+        assert mock_get.call_count == 1
+    
+    @patch('currency_converter.httpx.AsyncClient.get', new_callable=AsyncMock)
+    def test_httpx_backend(self, mock_get, rates_by_base):
+        """Test the HTTP/2 httpx backend converts and closes cleanly"""
+        mock_get.return_value = mock_http_response(rates_by_base["USD"])
+        converter = CurrencyConverter(backend="httpx")
+        
+        async def run():
+            async with converter:
+                return await asyncio.gather(
+                    converter.aconvert(100, "USD", "EUR"),
+                    converter.aconvert(2, "USD", "JPY")
+                )
+        
+        assert asyncio.run(run()) == [85.0, 220.0]
+        assert mock_get.call_count == 1
+        assert converter._client is None
+    
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_async_unexpected_not_modified(self, mock_get):
+        """Test an async 304 without a cached entry raises a client error"""
+        context = mock_aio_response({})
+        context.__aenter__.return_value.status = 304
+        mock_get.return_value = context
+        
+        async def run():
+            async with CurrencyConverter() as converter:
+                return await converter.aget_exchange_rates("USD")
+        
+        with pytest.raises(aiohttp.ClientError):
+            asyncio.run(run())
+    
+    @patch('currency_converter.logger')
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_async_timeout_logged(self, mock_get, mock_logger):
+        """Test aiohttp timeouts are logged like other fetch errors"""
+        context = MagicMock()
+        context.__aenter__.side_effect = asyncio.TimeoutError()
+        mock_get.return_value = context
+        
+        async def run():
+            async with CurrencyConverter() as converter:
+                return await converter.aget_exchange_rates("USD")
+        
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+        assert mock_logger.error.call_args.args[0] == (
+            "Error fetching exchange rates: %s"
+        )
+    
+    def test_httpx_backend_requires_h2(self):
+        """Test a missing HTTP/2 dependency is reported at construction"""
+        with patch.dict(sys.modules, {'h2': None}):
+            with pytest.raises(ImportError) as exc_info:
+                CurrencyConverter(backend="httpx")
+        
+        assert "httpx[http2]" in str(exc_info.value)
+    
+    def test_aclose_releases_everything(self, tmp_path):
+        """Test leaving the async context also closes the session and shelf"""
+        converter = CurrencyConverter(cache_dir=str(tmp_path))
+        
+        async def run():
+            async with converter:
+                assert converter._aiosession is not None
+        
+        with patch.object(converter.session, 'close') as mock_close:
+            asyncio.run(run())
+            assert mock_close.call_count == 1
+        assert converter._aiosession is None
+        assert converter._disk is None
+    
+    def test_unknown_backend(self):
+        """Test an unsupported backend name is rejected"""
+        with pytest.raises(ValueError):
+            CurrencyConverter(backend="urllib")
+    
+    @patch('currency_converter.requests.Session.get')
+    @patch('currency_converter.aiohttp.ClientSession.get')
+    def test_async_cross_and_supported_currencies(self, mock_get, mock_sync_get,
+                                                  rates_by_base):
+        """Test the async cross rate and currency list never use requests"""
+        mock_get.return_value = mock_aio_response(rates_by_base["USD"])
+        
+        async def run():
+            async with CurrencyConverter() as converter:
+                # 50 EUR -> JPY = 50 * 110.0 / 0.85
+                result = await converter.across(50, "EUR", "JPY")
+                return result, await converter.aget_supported_currencies()
+        
+        assert asyncio.run(run()) == (6470.59, ["EUR", "JPY"])
+        assert mock_get.call_count == 1
+        assert mock_sync_get.call_count == 0
+    
+    def test_async_requires_context_manager(self):
+        """Test the async API refuses to run without an open session"""
+        converter = CurrencyConverter()
+        
+        with pytest.raises(RuntimeError):
+            asyncio.run(converter.aconvert(100, "USD", "EUR"))
 
 
 if __name__ == "__main__":